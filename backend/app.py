@@ -1,93 +1,212 @@
 # app.py
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, g, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
+import os
 import sqlite3
-from database import init_db
+import zlib
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from werkzeug.exceptions import HTTPException
+from database import init_db, get_db, release_db
+
+# Serialize JSON with orjson, writing its bytes straight into the response
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+app.url_map.strict_slashes = False  # /feedback/ matches directly instead of redirecting
 CORS(app)  # Allow frontend to call API
 
 # Initialize database
 init_db()
-DB_FILE = 'feedback.db'
+
+# Check out at most one pooled connection of each kind per request
+def get_conn(readonly=False):
+    key = 'ro_db' if readonly else 'db'
+    if key not in g:
+        setattr(g, key, get_db(readonly))
+    return getattr(g, key)
+
+@app.teardown_appcontext
+def return_conn(exception):
+    for key, readonly in (('db', False), ('ro_db', True)):
+        conn = g.pop(key, None)
+        if conn is not None:
+            release_db(conn, readonly)
+
+# Every route reports failures in the same JSON shape
+@app.errorhandler(sqlite3.Error)
+def handle_db_error(e):
+    app.logger.exception(e)
+    return jsonify({"status": "error", "message": f"Database error: {str(e)}"}), 500
+
+@app.errorhandler(Exception)
+def handle_server_error(e):
+    if isinstance(e, HTTPException):
+        return e
+    app.logger.exception(e)
+    return jsonify({"status": "error", "message": f"Server error: {str(e)}"}), 500
+
+# Incoming feedback schema, compiled once at import
+class FeedbackIn(BaseModel):
+    name: str
+    email: str
+    product: Optional[str] = ''  # product might be optional
+    type: Literal['feedback', 'complaint', 'suggestion', 'praise', 'bug']
+    rating: int = Field(ge=1, le=5)
+    message: str
+    date: str
+    sentiment: str
+
+FeedbackList = TypeAdapter(List[FeedbackIn])
+
+INSERT_FEEDBACK_SQL = '''
+    INSERT INTO feedback (name, email, product, type, rating, message, date, sentiment)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# SQLite builds each row's JSON object itself, so no per-row Python dict is needed
+SELECT_FEEDBACK_SQL = '''
+    SELECT json_object('name', name, 'email', email, 'product', product, 'type', type,
+                       'rating', rating, 'message', message, 'date', date, 'sentiment', sentiment)
+    FROM feedback ORDER BY id DESC
+'''
+
+# Rows encoded per chunk when streaming GET /feedback
+STREAM_BATCH_SIZE = 500
+
+# Constant error bodies are encoded once at import. Each request still gets its
+# own Response, since after_request hooks such as CORS mutate response headers
+INVALID_JSON_ERROR = orjson.dumps({"status": "error", "message": "Request body must be valid JSON"})
+EXPECTED_LIST_ERROR = orjson.dumps({"status": "error", "message": "Expected a JSON list of feedback entries"})
+
+def error_response(body, status):
+    return app.response_class(body, status=status, mimetype='application/json')
+
+# Gzip a chunk stream incrementally so compressing never buffers the whole body
+def gzip_stream(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def validation_message(exc):
+    # Describe the first problem, keeping the old wording for missing fields;
+    # bulk errors are located as (index, field)
+    error = exc.errors()[0]
+    loc = error['loc']
+    prefix = ''
+    if loc and isinstance(loc[0], int):
+        prefix, loc = f"Entry {loc[0]}: ", loc[1:]
+    if not loc:
+        return f"{prefix}Expected a JSON object"
+    if error['type'] == 'missing' or error['input'] is None:
+        return f"{prefix}Missing required field: {loc[0]}"
+    return f"{prefix}Invalid value for {loc[0]}: {error['msg']}"
+
+def feedback_row(feedback):
+    return (
+        feedback.name,
+        feedback.email,
+        feedback.product,
+        feedback.type,
+        feedback.rating,
+        feedback.message,
+        feedback.date,
+        feedback.sentiment
+    )
 
 # Save new feedback
 @app.route('/feedback', methods=['POST'])
 def save_feedback():
+    data = request.get_json(silent=True)
+    if data is None:
+        return error_response(INVALID_JSON_ERROR, 400)
+    
     try:
-        data = request.json
-        
-        # Validate required fields
-        required_fields = ['name', 'email', 'type', 'rating', 'message', 'date', 'sentiment']
-        for field in required_fields:
-            if field not in data or data[field] is None:
-                return jsonify({"status": "error", "message": f"Missing required field: {field}"}), 400
-        
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO feedback (name, email, product, type, rating, message, date, sentiment)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            data['name'],
-            data['email'],
-            data.get('product', ''),  # product might be optional
-            data['type'],
-            data['rating'],
-            data['message'],
-            data['date'],
-            data['sentiment']
-        ))
-        conn.commit()
-        feedback_id = c.lastrowid
-        conn.close()
-        
-        return jsonify({
-            "status": "success",
-            "message": "Feedback saved successfully",
-            "id": feedback_id
-        })
-        
-    except sqlite3.Error as e:
-        return jsonify({"status": "error", "message": f"Database error: {str(e)}"}), 500
-    except Exception as e:
-        return jsonify({"status": "error", "message": f"Server error: {str(e)}"}), 500
+        feedback = FeedbackIn.model_validate(data)
+    except ValidationError as e:
+        return jsonify({"status": "error", "message": validation_message(e)}), 400
+    
+    conn = get_conn()
+    with conn:
+        c = conn.execute(INSERT_FEEDBACK_SQL, feedback_row(feedback))
+    feedback_id = c.lastrowid
+    
+    return jsonify({
+        "status": "success",
+        "message": "Feedback saved successfully",
+        "id": feedback_id
+    })
+
+# Save many feedback entries in a single transaction
+@app.route('/feedback/bulk', methods=['POST'])
+def save_feedback_bulk():
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return error_response(EXPECTED_LIST_ERROR, 400)
+    
+    # Validate every entry before writing anything
+    try:
+        entries = FeedbackList.validate_python(data)
+    except ValidationError as e:
+        return jsonify({"status": "error", "message": validation_message(e)}), 400
+    
+    conn = get_conn()
+    with conn:
+        conn.executemany(INSERT_FEEDBACK_SQL, [feedback_row(entry) for entry in entries])
+    
+    return jsonify({
+        "status": "success",
+        "message": "Feedback saved successfully",
+        "count": len(data)
+    })
 
 # Get all feedback
 @app.route('/feedback', methods=['GET'])
 def get_feedback():
-    try:
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
-        c.execute('SELECT name, email, product, type, rating, message, date, sentiment FROM feedback ORDER BY id DESC')
-        rows = c.fetchall()
-        conn.close()
-        
-        feedback_list = []
-        for row in rows:
-            feedback_list.append({
-                "name": row[0],
-                "email": row[1],
-                "product": row[2],
-                "type": row[3],
-                "rating": row[4],
-                "message": row[5],
-                "date": row[6],
-                "sentiment": row[7]
-            })
-        
-        return jsonify(feedback_list)
-        
-    except sqlite3.Error as e:
-        return jsonify({"status": "error", "message": f"Database error: {str(e)}"}), 500
-    except Exception as e:
-        return jsonify({"status": "error", "message": f"Server error: {str(e)}"}), 500
+    conn = get_conn(readonly=True)
+    c = conn.execute(SELECT_FEEDBACK_SQL)
+    
+    # Encode rows batch by batch so the full result set is never held in memory;
+    # the pooled connection stays checked out until the stream finishes
+    def generate():
+        sep = b'['
+        while True:
+            rows = c.fetchmany(STREAM_BATCH_SIZE)
+            if not rows:
+                break
+            yield sep + ','.join(row[0] for row in rows).encode()
+            sep = b','
+        yield b']' if sep == b',' else b'[]'
+    
+    body = generate()
+    headers = {'Vary': 'Accept-Encoding'}
+    if request.accept_encodings['gzip'] > 0:
+        body = gzip_stream(body)
+        headers['Content-Encoding'] = 'gzip'
+    
+    return Response(stream_with_context(body), mimetype='application/json', headers=headers)
 
 # Health check endpoint
 @app.route('/health', methods=['GET'])
 def health_check():
     return jsonify({"status": "healthy", "message": "Server is running"})
 
+# Development server only; production runs under gunicorn via wsgi.py
 if __name__ == '__main__':
     print("Starting Flask server...")
-    app.run(debug=True, host='localhost', port=5000)
\ No newline at end of file
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='localhost', port=5000)
\ No newline at end of file
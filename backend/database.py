@@ -1,8 +1,58 @@
 # database.py
+import queue
 import sqlite3
 
+DB_FILE = 'feedback.db'
+WRITER_POOL_SIZE = 1
+READER_POOL_SIZE = 8
+
+# Idle connections kept open between requests: read-only ones for GET routes
+# so reads never wait behind the writer under WAL
+_pools = {
+    False: queue.Queue(maxsize=WRITER_POOL_SIZE),
+    True: queue.Queue(maxsize=READER_POOL_SIZE),
+}
+
+# Per-connection tuning; journal_mode=WAL is persistent and set once in init_db
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+def _apply_pragmas(conn):
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+def _connect(readonly):
+    mode = 'ro' if readonly else 'rwc'
+    # Writes take the write lock up front (BEGIN IMMEDIATE) instead of upgrading mid-transaction
+    conn = sqlite3.connect(f'file:{DB_FILE}?mode={mode}', uri=True, check_same_thread=False,
+                           timeout=30, isolation_level='IMMEDIATE')
+    conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn)
+    return conn
+
+def get_db(readonly=False):
+    # Reuse an idle connection, only opening a new one when the pool is empty
+    try:
+        return _pools[readonly].get_nowait()
+    except queue.Empty:
+        return _connect(readonly)
+
+def release_db(conn, readonly=False):
+    # Drop anything a failed request left uncommitted before handing it out again
+    conn.rollback()
+    try:
+        _pools[readonly].put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
 def init_db():
-    conn = sqlite3.connect('feedback.db')
+    conn = sqlite3.connect(DB_FILE)
+    conn.execute("PRAGMA journal_mode=WAL")
+    _apply_pragmas(conn)
     c = conn.cursor()
     c.execute('''
         CREATE TABLE IF NOT EXISTS feedback (
@@ -0,0 +1,2 @@
+# wsgi.py
+from app import app
\ No newline at end of file